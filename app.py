@@ -21,22 +21,50 @@ json response from valid address:
 
 """
 
-from flask import Flask, render_template, jsonify, request, send_from_directory
+from quart import Quart, render_template, jsonify, request, send_from_directory
 import os
+import asyncio
+import aiohttp
+import redis
 import psycopg2
-import requests
+import psycopg2.errors
+import psycopg2.extensions
+from psycopg2.extras import Json, RealDictCursor, execute_values
+from psycopg2.pool import ThreadedConnectionPool
 import json
+import orjson
 import logging
 import random
-from jinja2 import Template
+import threading
+from jinja2 import Environment, FileSystemLoader, TemplateNotFound
 from datetime import datetime
-from functools import wraps
+from functools import lru_cache, wraps
+from types import MappingProxyType
+from contextlib import contextmanager
+from itertools import islice
+from rq import Queue
+from rq.exceptions import NoSuchJobError
+from rq.job import Job, JobStatus
 
 
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
 
-app = Flask(__name__)
+app = Quart(__name__)
+
+# SmartyStreets US Street API accepts at most 100 lookups per request
+SMARTY_BATCH_SIZE = 100
+
+# Range of the int4 contacts.id primary key
+PG_INT4_MIN = -2**31
+PG_INT4_MAX = 2**31 - 1
+
+# Rows fetched per round-trip when streaming /api/contacts
+CONTACTS_STREAM_BATCH_SIZE = 2000
+
+# Connection pool size and idle keep-alive (seconds) for SmartyStreets requests
+SMARTY_POOL_MAXSIZE = 50
+SMARTY_KEEPALIVE_TIMEOUT = 60
 
 app.config.update(
     DB_HOST=os.getenv('DB_HOST', 'postgres-service'),
@@ -44,19 +72,50 @@ app.config.update(
     DB_NAME=os.getenv('POSTGRES_DB', 'postgres'),
     DB_USERNAME=os.getenv('DB_USERNAME', 'postgres'),
     POSTGRES_PASSWORD=os.getenv('POSTGRES_PASSWORD', None),
+    DB_POOL_MIN=int(os.getenv('DB_POOL_MIN', 2)),
+    DB_POOL_MAX=int(os.getenv('DB_POOL_MAX', 20)),
+    DB_STREAM_MAX=int(os.getenv('DB_STREAM_MAX', 5)),
     SMARTY_AUTH_ID=os.getenv('SMARTY_AUTH_ID', None),
     SMARTY_AUTH_TOKEN=os.getenv('SMARTY_AUTH_TOKEN', None),
+    SMARTY_MAX_CONCURRENCY=int(os.getenv('SMARTY_MAX_CONCURRENCY', 32)),
+    REDIS_URL=os.getenv('REDIS_URL', 'redis://redis-service:6379/0'),
+    VALIDATION_JOB_TIMEOUT=int(os.getenv('VALIDATION_JOB_TIMEOUT', 600)),
     TEMPLATE_STYLE=os.getenv('TEMPLATE_STYLE', 'random'),
     TEMPLATES_DIR=os.getenv('TEMPLATES_DIR', 'templates'),
     OUTPUT_DIR=os.getenv('OUTPUT_DIR', 'static/generated')
 )
 
+# Compiled export templates are kept in the environment cache, so each file
+# is read and parsed once per process
+template_env = Environment(
+    loader=FileSystemLoader(app.config['TEMPLATES_DIR']),
+    auto_reload=False,
+    cache_size=400
+)
+
+# Queue for long-running validation batches, consumed by `rq worker validation`
+redis_conn = redis.Redis.from_url(app.config['REDIS_URL'])
+validation_queue = Queue('validation', connection=redis_conn)
+
+# Database connection pool, created lazily by get_db_pool
+db_pool = None
+db_pool_lock = threading.Lock()
+# ThreadedConnectionPool raises PoolError when exhausted, so borrowers wait
+# here for a free slot instead
+db_pool_slots = threading.BoundedSemaphore(app.config['DB_POOL_MAX'])
+
+# Concurrent /api/contacts streams per worker; kept well below DB_POOL_MAX
+contact_stream_slots = asyncio.Semaphore(app.config['DB_STREAM_MAX'])
+
+# Shared HTTP session for SmartyStreets, opened once per worker in before_serving
+smarty_session = None
+
 def handle_db_errors(f):
     """Decorator to handle database connection errors"""
     @wraps(f)
-    def decorated_function(*args, **kwargs):
+    async def decorated_function(*args, **kwargs):
         try:
-            return f(*args, **kwargs)
+            return await f(*args, **kwargs)
         except psycopg2.Error as e:
             logger.error(f"Database error: {e}")
             return jsonify({'error': 'Database connection failed'}), 500
@@ -65,107 +124,293 @@ def handle_db_errors(f):
             return jsonify({'error': 'Internal server error'}), 500
     return decorated_function
 
-def validate_address_smarty(address, city, state, zipcode, auth_id=None, auth_token=None):
-    """Validate address using SmartyStreets API"""
+def jsonify_fast(obj):
+    """Serialize obj to a JSON response with orjson"""
+    return app.response_class(orjson.dumps(obj), mimetype='application/json')
+
+def chunked(iterable, size):
+    """Yield successive lists of at most size items from iterable"""
+    iterator = iter(iterable)
+    while chunk := list(islice(iterator, size)):
+        yield chunk
+
+def create_smarty_session():
+    """Create an HTTP session that keeps SmartyStreets connections alive"""
+    # Idle TCP+TLS connections are held for reuse instead of re-handshaking
+    connector = aiohttp.TCPConnector(
+        limit=SMARTY_POOL_MAXSIZE,
+        limit_per_host=SMARTY_POOL_MAXSIZE,
+        keepalive_timeout=SMARTY_KEEPALIVE_TIMEOUT
+    )
+    return aiohttp.ClientSession(connector=connector)
+
+async def validate_addresses_smarty(session, contacts, auth_id=None, auth_token=None):
+    """Validate a batch of up to 100 contact addresses using the SmartyStreets API
+
+    Returns one validation result per contact, in the same order as contacts.
+    """
     if not auth_id or not auth_token:
         logger.warning("SmartyStreets credentials not provided, skipping validation")
-        return "Not Validated"
+        return ["Not Validated"] * len(contacts)
 
     try:
         # could probably make this more dynamic/hidden
         url = "https://us-street.api.smartystreets.com/street-address"
         params = {
             'auth-id': auth_id,
-            'auth-token': auth_token,
-            'street': address,
-            'city': city,
-            'state': state,
-            'zipcode': zipcode
+            'auth-token': auth_token
         }
-
-        response = requests.get(url, params=params, timeout=10)
-
-        if response.status_code == 200:
-            data = response.json()
-            if data and len(data) > 0:
-                return data
+        lookups = [
+            {
+                'input_id': str(contact['id']),
+                'street': contact['address'],
+                'city': contact['city'],
+                'state': contact['state'],
+                'zipcode': contact['zipcode']
+            }
+            for contact in contacts
+        ]
+
+        async with session.post(url, params=params, json=lookups,
+                                timeout=aiohttp.ClientTimeout(total=10)) as response:
+            if response.status == 200:
+                data = await response.json()
             else:
-                return False
-        else:
-            logger.warning(f"SmartyStreets API error: {response.status_code}")
-            return "API Error"
+                logger.warning(f"SmartyStreets API error: {response.status}")
+                return ["API Error"] * len(contacts)
 
-    except requests.RequestException as e:
+    except (aiohttp.ClientError, asyncio.TimeoutError) as e:
         logger.error(f"Address validation failed: {e}")
-        return "Validation Failed"
+        return ["Validation Failed"] * len(contacts)
+
+    # Unmatched addresses get no candidates, so anything left empty is invalid
+    candidates = [[] for _ in contacts]
+    for candidate in data:
+        candidates[candidate['input_index']].append(candidate)
+
+    return [matches or False for matches in candidates]
+
+async def validate_all_addresses_smarty(session, contacts, auth_id=None, auth_token=None,
+                                        max_concurrency=32):
+    """Validate any number of contacts in 100-address batches sent in parallel
+
+    At most max_concurrency batch requests are in flight at once. Returns one
+    validation result per contact, in the same order as contacts.
+    """
+    semaphore = asyncio.Semaphore(max_concurrency)
+
+    async def validate_batch(batch):
+        async with semaphore:
+            return await validate_addresses_smarty(session, batch, auth_id, auth_token)
+
+    batch_results = await asyncio.gather(*[
+        validate_batch(batch) for batch in chunked(contacts, SMARTY_BATCH_SIZE)
+    ])
+    return [result for batch in batch_results for result in batch]
+
+# Hot-path statements prepared once per pooled connection, so PostgreSQL
+# parses and plans them a single time per session. Session-level prepared
+# statements do not survive PgBouncer transaction pooling.
+# valid holds the raw SmartyStreets result as JSONB: a candidate array when the
+# address matched, false when it did not, or a status string if the lookup
+# never happened. JSON true only appears on rows converted from the old
+# BOOLEAN column; NULL means the contact has not been validated.
+CONTACT_COLUMNS = """
+    id, first_name, last_name, address, city, state, zipcode, country, valid,
+    CASE WHEN jsonb_typeof(valid) = 'array' OR valid = 'true' THEN 'valid'
+         WHEN valid = 'false' THEN 'invalid'
+         ELSE 'not-validated' END AS css_class,
+    CASE WHEN jsonb_typeof(valid) = 'array' OR valid = 'true' THEN 'valid-badge'
+         WHEN valid = 'false' THEN 'invalid-badge'
+         ELSE 'not-validated-badge' END AS badge_class,
+    CASE WHEN jsonb_typeof(valid) = 'array' OR valid = 'true' THEN 'Valid Address'
+         WHEN valid = 'false' THEN 'Invalid Address'
+         ELSE 'Not Validated' END AS validation_text
+"""
+
+PREPARED_STATEMENTS = {
+    'fetch_contacts': f"""
+        SELECT {CONTACT_COLUMNS}
+        FROM public.contacts 
+        ORDER BY last_name, first_name
+    """,
+    'fetch_contact_by_id': f"""
+        SELECT {CONTACT_COLUMNS}
+        FROM public.contacts 
+        WHERE id = $1
+    """,
+    'has_contacts': "SELECT EXISTS (SELECT 1 FROM public.contacts)",
+    'update_validation_status': "UPDATE contacts SET valid = $1 WHERE id = $2"
+}
+
+# Errors raised when a prepared plan no longer matches the schema, e.g. after
+# an ALTER COLUMN ... TYPE: a changed result type, or a parameter still typed
+# for the old column
+STALE_PLAN_ERRORS = (
+    psycopg2.errors.FeatureNotSupported,
+    psycopg2.errors.DatatypeMismatch,
+    psycopg2.errors.InvalidTextRepresentation
+)
 
+class PreparedConnection(psycopg2.extensions.connection):
+    """Connection that prepares PREPARED_STATEMENTS when it is opened"""
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.prepare_statements()
+
+    def prepare_statements(self):
+        """(Re)create every statement in PREPARED_STATEMENTS for this session"""
+        cursor = self.cursor()
+        cursor.execute("DEALLOCATE ALL")
+        for name, statement in PREPARED_STATEMENTS.items():
+            cursor.execute(f"PREPARE {name} AS {statement}")
+        self.commit()
+        cursor.close()
+
+    def execute_prepared(self, cursor, name, params=()):
+        """EXECUTE a prepared statement, re-preparing once if its plan is stale"""
+        query = f"EXECUTE {name}"
+        if params:
+            query += f" ({', '.join(['%s'] * len(params))})"
+
+        try:
+            cursor.execute(query, params or None)
+        except STALE_PLAN_ERRORS as e:
+            logger.warning(f"Re-preparing statements after schema change: {e}")
+            self.rollback()
+            self.prepare_statements()
+            cursor.execute(query, params or None)
+
+def get_db_pool():
+    """Return the process-wide connection pool, creating it on first use"""
+    global db_pool
+    with db_pool_lock:
+        if db_pool is None:
+            try:
+                db_pool = ThreadedConnectionPool(
+                    minconn=app.config['DB_POOL_MIN'],
+                    maxconn=app.config['DB_POOL_MAX'],
+                    host=app.config['DB_HOST'],
+                    port=app.config['DB_PORT'],
+                    database=app.config['DB_NAME'],
+                    user=app.config['DB_USERNAME'],
+                    password=app.config['POSTGRES_PASSWORD'],
+                    connection_factory=PreparedConnection
+                )
+            except psycopg2.Error as e:
+                logger.critical(f"Database connection failed: {e}")
+                raise
+    return db_pool
+
+@contextmanager
 def get_db_connection():
-    """Get database connection"""
-    try:
-        conn = psycopg2.connect(
-            host=app.config['DB_HOST'],
-            port=app.config['DB_PORT'],
-            database=app.config['DB_NAME'],
-            user=app.config['DB_USERNAME'],
-            password=app.config['POSTGRES_PASSWORD']
-        )
-        return conn
-    except psycopg2.Error as e:
-        logger.critical(f"Database connection failed: {e}")
-        raise
+    """Borrow a database connection from the pool, waiting if none are free"""
+    pool = get_db_pool()
+    with db_pool_slots:
+        conn = pool.getconn()
+        try:
+            yield conn
+        finally:
+            pool.putconn(conn)
 
 def fetch_contacts():
     """Fetch all contacts from database"""
-    conn = get_db_connection()
-    try:
-        cursor = conn.cursor()
-        cursor.execute("""
-            SELECT id, first_name, last_name, address, city, state, zipcode, country, valid 
-            FROM public.contacts 
-            ORDER BY last_name, first_name
-        """)
-
-        columns = [desc[0] for desc in cursor.description]
-        contacts = []
-        for row in cursor.fetchall():
-            contact = dict(zip(columns, row))
-            contacts.append(contact)
-
+    with get_db_connection() as conn:
+        cursor = conn.cursor(cursor_factory=RealDictCursor)
+        conn.execute_prepared(cursor, 'fetch_contacts')
+        contacts = cursor.fetchall()
         cursor.close()
         logger.info(f"Fetched {len(contacts)} contacts from database")
         return contacts
 
-    finally:
-        conn.close()
+def iter_contact_batches(batch_size=CONTACTS_STREAM_BATCH_SIZE):
+    """Yield lists of contacts read through a server-side cursor"""
+    with get_db_connection() as conn:
+        # Named cursors run DECLARE, which cannot wrap a prepared EXECUTE
+        cursor = conn.cursor(name='contacts_stream', cursor_factory=RealDictCursor)
+        try:
+            cursor.execute(f"""
+                SELECT {CONTACT_COLUMNS}
+                FROM public.contacts 
+                ORDER BY last_name, first_name
+            """)
+            while batch := cursor.fetchmany(batch_size):
+                yield batch
+        finally:
+            cursor.close()
+
+def fetch_contact_by_id(contact_id):
+    """Fetch a single contact by primary key, or None if it does not exist"""
+    # contacts.id is a SERIAL (int4); larger ids cannot exist and would make
+    # the prepared statement raise NumericValueOutOfRange
+    if not PG_INT4_MIN <= contact_id <= PG_INT4_MAX:
+        return None
+
+    with get_db_connection() as conn:
+        cursor = conn.cursor(cursor_factory=RealDictCursor)
+        conn.execute_prepared(cursor, 'fetch_contact_by_id', (contact_id,))
+        contact = cursor.fetchone()
+        cursor.close()
+        return dict(contact) if contact else None
+
+def has_contacts():
+    """Return True if the contacts table has at least one row"""
+    with get_db_connection() as conn:
+        cursor = conn.cursor()
+        conn.execute_prepared(cursor, 'has_contacts')
+        exists, = cursor.fetchone()
+        cursor.close()
+        return exists
+
+def ping_database():
+    """Run a trivial query to confirm the database is reachable"""
+    with get_db_connection() as conn:
+        cursor = conn.cursor()
+        cursor.execute("SELECT 1")
+        cursor.close()
 
 def update_validation_status(contact_id, validation_result):
-    """Update validation status in database with boolean value"""
-    conn = get_db_connection()
-    try:
+    """Store the SmartyStreets validation result as JSONB"""
+    with get_db_connection() as conn:
         cursor = conn.cursor()
         
-        # Convert complex result to boolean
-        is_valid = bool(validation_result and validation_result != "API Error" 
-                       and validation_result != "Validation Failed" 
-                       and validation_result != "Not Validated")
-        
-        cursor.execute(
-            "UPDATE contacts SET valid = %s WHERE id = %s",
-            (is_valid, contact_id)
+        conn.execute_prepared(
+            cursor,
+            'update_validation_status',
+            (Json(validation_result), contact_id)
+        )
+        conn.commit()
+        cursor.close()
+
+def bulk_update_validation_status(contacts, validation_results):
+    """Update validation status for many contacts in a single statement"""
+    with get_db_connection() as conn:
+        cursor = conn.cursor()
+        rows = [(contact['id'], Json(result))
+                for contact, result in zip(contacts, validation_results)]
+        # page_size covers every row so the whole update is one round-trip
+        execute_values(
+            cursor,
+            """
+            UPDATE contacts SET valid = data.v::jsonb
+            FROM (VALUES %s) AS data(id, v)
+            WHERE contacts.id = data.id
+            """,
+            rows,
+            page_size=max(len(rows), 1)
         )
         conn.commit()
         cursor.close()
-    finally:
-        conn.close()
 
+@lru_cache(maxsize=1)
 def get_template_files():
-    """Return mapping of template styles to filenames"""
-    return {
+    """Return read-only mapping of template styles to filenames"""
+    return MappingProxyType({
         "modern": "modern_template.html",
         "dark": "dark_template.html",
         "neon": "neon_template.html",
         "retro": "retro_template.html"
-    }
+    })
 
 def select_template_style(template_style="random"):
     """Select template style, handling random selection"""
@@ -178,52 +423,28 @@ def select_template_style(template_style="random"):
 
     return template_style
 
-def load_template(template_style, templates_dir="templates"):
-    """Load and return template content from file"""
+def load_template(template_style):
+    """Return the compiled template for a style, parsing it only on first use"""
     template_files = get_template_files()
     template_filename = template_files.get(template_style, template_files["modern"])
-    template_path = os.path.join(templates_dir, template_filename)
 
-    if not os.path.exists(template_path):
+    try:
+        return template_env.get_template(template_filename)
+    except TemplateNotFound:
+        template_path = os.path.join(app.config['TEMPLATES_DIR'], template_filename)
         raise FileNotFoundError(f"Template file not found: {template_path}")
 
-    with open(template_path, 'r', encoding='utf-8') as f:
-        return f.read()
-
-def get_validation_attributes(valid_status):
-    """Return CSS class, badge class, and validation text based on status"""
-    if valid_status == 'valid':
-        return 'valid', 'valid-badge', 'Valid Address'
-    elif valid_status == 'invalid':
-        return 'invalid', 'invalid-badge', 'Invalid Address'
-    else:
-        return 'not-validated', 'not-validated-badge', 'Not Validated'
-
-def prepare_contact_data(contacts):
-    """Add validation styling attributes to contact data"""
-    for contact in contacts:
-        valid_status = contact.get('valid', '')
-        css_class, badge_class, validation_text = get_validation_attributes(valid_status)
-
-        contact['css_class'] = css_class
-        contact['badge_class'] = badge_class
-        contact['validation_text'] = validation_text
-
-    return contacts
-
 def prepare_template_data(contacts):
     """Prepare all data needed for template rendering"""
-    prepared_contacts = prepare_contact_data(contacts)
-
+    # Validation styling (css_class, badge_class, validation_text) comes from fetch_contacts
     return {
-        'contacts': prepared_contacts,
+        'contacts': contacts,
         'timestamp': datetime.now().strftime('%Y-%m-%d %H:%M:%S')
     }
 
-def render_custom_template(template_content, template_data):
-    """Render Jinja template with provided data"""
-    template = Template(template_content)
-    return template.render(**template_data)
+def render_custom_template(template, template_data, output_path):
+    """Render Jinja template with provided data, streaming chunks to output_path"""
+    template.stream(**template_data).dump(output_path, encoding='utf-8')
 
 def generate_html_file(contacts, template_style="random", output_filename="index.html"):
     """Generate HTML file from contacts data using external Jinja templates"""
@@ -233,134 +454,207 @@ def generate_html_file(contacts, template_style="random", output_filename="index
     # Select template style
     selected_style = select_template_style(template_style)
     
-    # Load template content
-    template_content = load_template(selected_style, app.config['TEMPLATES_DIR'])
+    # Load compiled template
+    template = load_template(selected_style)
     
     # Prepare template data
     template_data = prepare_template_data(contacts)
     
-    # Render template
-    html_content = render_custom_template(template_content, template_data)
-    
-    # Write to file
+    # Render template straight to file
     output_path = os.path.join(app.config['OUTPUT_DIR'], output_filename)
-    with open(output_path, 'w', encoding='utf-8') as f:
-        f.write(html_content)
+    render_custom_template(template, template_data, output_path)
     
     logger.info(f"HTML file generated: {output_path}")
     return output_path, selected_style
 
-# Flask Routes
+async def validate_contacts(contacts):
+    """Validate contacts against SmartyStreets using a dedicated HTTP session"""
+    async with create_smarty_session() as session:
+        return await validate_all_addresses_smarty(
+            session,
+            contacts,
+            app.config['SMARTY_AUTH_ID'],
+            app.config['SMARTY_AUTH_TOKEN'],
+            app.config['SMARTY_MAX_CONCURRENCY']
+        )
+
+def run_validation_batch():
+    """RQ job: validate all addresses and store the results"""
+    contacts = fetch_contacts()
+    results = asyncio.run(validate_contacts(contacts))
+    
+    # Update database
+    bulk_update_validation_status(contacts, results)
+    
+    validated_contacts = []
+    
+    for contact, validation_result in zip(contacts, results):
+        # Update contact data
+        contact['valid'] = validation_result
+        validated_contacts.append(contact)
+        
+        logger.info(f"Validated {contact['first_name']} {contact['last_name']}: {validation_result}")
+    
+    return {
+        'message': 'Address validation completed',
+        'contacts': validated_contacts,
+        'count': len(validated_contacts)
+    }
+
+# Quart Routes
+
+@app.before_serving
+async def open_smarty_session():
+    """Open the shared SmartyStreets HTTP session"""
+    global smarty_session
+    smarty_session = create_smarty_session()
+
+@app.after_serving
+async def close_smarty_session():
+    """Close the shared SmartyStreets HTTP session"""
+    await smarty_session.close()
+
+@app.after_serving
+async def close_db_pool():
+    """Close all pooled database connections"""
+    if db_pool is not None:
+        db_pool.closeall()
 
 @app.route('/')
-def index():
+async def index():
     """Main page showing contacts"""
-    return render_template('index.html')
+    return await render_template('index.html')
 
 @app.route('/api/contacts')
 @handle_db_errors
-def api_contacts():
+async def api_contacts():
     """API endpoint to get all contacts"""
-    contacts = fetch_contacts()
-    return jsonify({
-        'contacts': contacts,
-        'count': len(contacts),
-        'timestamp': datetime.now().isoformat()
-    })
+    # Make sure the pool exists before streaming so an unreachable database
+    # still gets a JSON 500 rather than a truncated body
+    await asyncio.to_thread(get_db_pool)
+    timestamp = datetime.now().isoformat()
+    
+    async def generate():
+        # A stream holds its pooled connection until the client has read every
+        # batch, so only DB_STREAM_MAX streams run at once and slow readers
+        # cannot starve the rest of the app of connections
+        async with contact_stream_slots:
+            batches = iter_contact_batches()
+            fetch = None
+            count = 0
+            try:
+                yield b'{"contacts":['
+                while True:
+                    # Shielded so a cancelled request never leaves a fetch
+                    # running in its thread while the generator is closed
+                    fetch = asyncio.ensure_future(asyncio.to_thread(next, batches, None))
+                    batch = await asyncio.shield(fetch)
+                    if batch is None:
+                        break
+                    yield (b',' if count else b'') + orjson.dumps(batch)[1:-1]
+                    count += len(batch)
+                yield b'],"count":' + orjson.dumps(count) + b',"timestamp":' + orjson.dumps(timestamp) + b'}'
+            finally:
+                if fetch is not None and not fetch.done():
+                    await asyncio.wait([fetch])
+                await asyncio.to_thread(batches.close)
+    
+    return app.response_class(generate(), mimetype='application/json')
 
 @app.route('/api/contacts/<int:contact_id>')
 @handle_db_errors
-def api_contact_detail(contact_id):
+async def api_contact_detail(contact_id):
     """API endpoint to get specific contact"""
-    contacts = fetch_contacts()
-    contact = next((c for c in contacts if c['id'] == contact_id), None)
+    contact = await asyncio.to_thread(fetch_contact_by_id, contact_id)
     
     if not contact:
         return jsonify({'error': 'Contact not found'}), 404
     
-    return jsonify(contact)
+    return jsonify_fast(contact)
 
 @app.route('/api/validate', methods=['POST'])
 @handle_db_errors
-def api_validate_addresses():
+async def api_validate_addresses():
     """API endpoint to validate all addresses"""
-    contacts = fetch_contacts()
-    
-    if not contacts:
+    if not await asyncio.to_thread(has_contacts):
         return jsonify({'error': 'No contacts found'}), 404
     
-    validated_contacts = []
-    
-    for contact in contacts:
-        validation_result = validate_address_smarty(
-            contact['address'],
-            contact['city'],
-            contact['state'],
-            contact['zipcode'],
-            app.config['SMARTY_AUTH_ID'],
-            app.config['SMARTY_AUTH_TOKEN']
-        )
-        
-        # Update database
-        update_validation_status(contact['id'], validation_result)
-        
-        # Update contact data
-        contact['valid'] = validation_result
-        validated_contacts.append(contact)
-        
-        logger.info(f"Validated {contact['first_name']} {contact['last_name']}: {validation_result}")
+    # Hand the batch to an RQ worker so this request returns immediately
+    job = await asyncio.to_thread(
+        validation_queue.enqueue,
+        'app.run_validation_batch',
+        job_timeout=app.config['VALIDATION_JOB_TIMEOUT']
+    )
+    logger.info(f"Queued address validation as job {job.id}")
     
     return jsonify({
-        'message': 'Address validation completed',
-        'contacts': validated_contacts,
-        'count': len(validated_contacts)
-    })
+        'message': 'Address validation queued',
+        'job_id': job.id,
+        'status_url': f'/api/validate/status/{job.id}'
+    }), 202
+
+@app.route('/api/validate/status/<job_id>')
+@handle_db_errors
+async def api_validation_status(job_id):
+    """API endpoint to get the status of a queued validation job"""
+    try:
+        job = await asyncio.to_thread(Job.fetch, job_id, connection=redis_conn)
+    except NoSuchJobError:
+        return jsonify({'error': 'Job not found'}), 404
+    
+    status = await asyncio.to_thread(job.get_status)
+    response = {
+        'job_id': job.id,
+        'status': status
+    }
+    if status == JobStatus.FINISHED:
+        response['result'] = job.result
+    
+    return jsonify_fast(response)
 
 @app.route('/api/validate/<int:contact_id>', methods=['POST'])
 @handle_db_errors
-def api_validate_single_address(contact_id):
+async def api_validate_single_address(contact_id):
     """API endpoint to validate single address"""
-    contacts = fetch_contacts()
-    contact = next((c for c in contacts if c['id'] == contact_id), None)
+    contact = await asyncio.to_thread(fetch_contact_by_id, contact_id)
     
     if not contact:
         return jsonify({'error': 'Contact not found'}), 404
     
-    validation_result = validate_address_smarty(
-        contact['address'],
-        contact['city'],
-        contact['state'],
-        contact['zipcode'],
+    validation_result, = await validate_addresses_smarty(
+        smarty_session,
+        [contact],
         app.config['SMARTY_AUTH_ID'],
         app.config['SMARTY_AUTH_TOKEN']
     )
     
     # Update database
-    update_validation_status(contact_id, validation_result)
+    await asyncio.to_thread(update_validation_status, contact_id, validation_result)
     contact['valid'] = validation_result
     
     logger.info(f"Validated {contact['first_name']} {contact['last_name']}: {validation_result}")
     
-    return jsonify({
+    return jsonify_fast({
         'message': 'Address validation completed',
         'contact': contact
     })
 
 @app.route('/api/generate', methods=['POST'])
 @handle_db_errors
-def api_generate_html():
+async def api_generate_html():
     """API endpoint to generate HTML file"""
-    data = request.get_json() or {}
+    data = (await request.get_json()) or {}
     template_style = data.get('template_style', app.config['TEMPLATE_STYLE'])
     output_filename = data.get('output_filename', 'index.html')
     
-    contacts = fetch_contacts()
+    contacts = await asyncio.to_thread(fetch_contacts)
     
     if not contacts:
         return jsonify({'error': 'No contacts found'}), 404
     
     try:
-        output_path, selected_style = generate_html_file(contacts, template_style, output_filename)
+        output_path, selected_style = await asyncio.to_thread(
+            generate_html_file, contacts, template_style, output_filename)
         
         return jsonify({
             'message': 'HTML file generated successfully',
@@ -374,15 +668,15 @@ def api_generate_html():
         return jsonify({'error': str(e)}), 400
 
 @app.route('/download/<filename>')
-def download_file(filename):
+async def download_file(filename):
     """Download generated HTML files"""
     try:
-        return send_from_directory(app.config['OUTPUT_DIR'], filename)
+        return await send_from_directory(app.config['OUTPUT_DIR'], filename)
     except FileNotFoundError:
         return jsonify({'error': 'File not found'}), 404
 
 @app.route('/api/templates')
-def api_template_styles():
+async def api_template_styles():
     """API endpoint to get available template styles"""
     return jsonify({
         'template_styles': list(get_template_files().keys()),
@@ -390,12 +684,11 @@ def api_template_styles():
     })
 
 @app.route('/api/health')
-def health_check():
+async def health_check():
     """Health check endpoint"""
     try:
         # Test database connection
-        conn = get_db_connection()
-        conn.close()
+        await asyncio.to_thread(ping_database)
         db_status = "healthy"
     except Exception as e:
         db_status = f"error: {str(e)}"
@@ -408,7 +701,7 @@ def health_check():
     })
 
 @app.route('/api/config')
-def api_config():
+async def api_config():
     """API endpoint to get current configuration (non-sensitive)"""
     return jsonify({
         'template_style': app.config['TEMPLATE_STYLE'],
@@ -418,21 +711,21 @@ def api_config():
     })
 
 @app.errorhandler(404)
-def not_found(error):
+async def not_found(error):
     return jsonify({'error': 'Not found'}), 404
 
 @app.errorhandler(500)
-def internal_error(error):
+async def internal_error(error):
     return jsonify({'error': 'Internal server error'}), 500
 
 if __name__ == '__main__':
     # Ensure required directories exist
     os.makedirs(app.config['OUTPUT_DIR'], exist_ok=True)
     
-    # Run the Flask app
+    # Run the Quart app (use uvicorn in production)
     debug_mode = os.getenv('FLASK_DEBUG', 'False').lower() == 'true'
     port = int(os.getenv('FLASK_PORT', 3000))
     host = os.getenv('FLASK_HOST', '0.0.0.0')
     
-    logger.info(f"Starting Flask app on {host}:{port} (debug={debug_mode})")
+    logger.info(f"Starting Quart app on {host}:{port} (debug={debug_mode})")
     app.run(host=host, port=port, debug=debug_mode)
\ No newline at end of file
@@ -12,7 +12,7 @@ psql -v ON_ERROR_STOP=1 --username "$POSTGRES_USER" --dbname "$POSTGRES_DB" <<-E
         state VARCHAR(2),
         zipcode VARCHAR(10),
         country VARCHAR(3),
-        valid BOOLEAN DEFAULT true
+        valid JSONB
     );
 
     -- Load CSV data into the table
@@ -21,6 +21,9 @@ psql -v ON_ERROR_STOP=1 --username "$POSTGRES_USER" --dbname "$POSTGRES_DB" <<-E
     DELIMITER ','
     CSV HEADER;
 
+    -- Lets ORDER BY last_name, first_name read the index instead of sorting
+    CREATE INDEX IF NOT EXISTS idx_contacts_lastfirst ON contacts (last_name, first_name);
+
     -- Optional: Display count of loaded records
     SELECT COUNT(*) as total_contacts FROM contacts;
 EOSQL
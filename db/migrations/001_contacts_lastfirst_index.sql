@@ -0,0 +1,5 @@
+-- Backs the ORDER BY last_name, first_name in fetch_contacts on databases
+-- created before init-db.sh added the index. CONCURRENTLY avoids locking
+-- writes, so run this outside a transaction block:
+--   psql -h localhost -U postgres -d postgres -f db/migrations/001_contacts_lastfirst_index.sql
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_contacts_lastfirst ON contacts (last_name, first_name);
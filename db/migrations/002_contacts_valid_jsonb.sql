@@ -0,0 +1,15 @@
+-- Stores the full SmartyStreets validation result instead of a boolean, for
+-- databases created before init-db.sh declared valid as JSONB. Existing
+-- true/false values become JSON true/false. The old default is dropped, so
+-- rows inserted without a value stay NULL (Not Validated).
+--
+-- Running app and worker connections hold statements prepared against the
+-- BOOLEAN column. PreparedConnection re-prepares them on the first stale-plan
+-- error. Until each connection has done that, expect one logged warning per
+-- connection. To avoid that window, scale the contact-app and contact-worker
+-- deployments down first, or restart them right after this runs.
+--   psql -h localhost -U postgres -d postgres -f db/migrations/002_contacts_valid_jsonb.sql
+BEGIN;
+ALTER TABLE contacts ALTER COLUMN valid DROP DEFAULT;
+ALTER TABLE contacts ALTER COLUMN valid TYPE jsonb USING to_jsonb(valid);
+COMMIT;
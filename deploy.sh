@@ -120,6 +120,7 @@ echo "  Monitoring Commands:"
 echo "   kubectl get all -n contact-system"
 echo "   kubectl logs -f deployment/contact-app -n contact-system"
 echo "   kubectl logs -f deployment/postgres-db -n contact-system"
+echo "   kubectl logs -f deployment/contact-worker -n contact-system"
 echo
 
 echo "🧹 Cleanup:"